@@ -5,7 +5,7 @@ boards.py
 Sample Sudoku boards used by `sudoku_solver.py`.
 
 Feel free to replace or extend these boards with your own puzzles.
-`-1` denotes an empty cell.
+`-1` (or 0) denotes an empty cell.
 """
 
 # Classic “easy” puzzle (from Project Euler #96, translated to list-of-lists)
@@ -47,7 +47,8 @@ IMPOSSIBLE_BOARD = [
     [-1, -1, -1, -1, 8, -1, -1, 7, 9],
 ]
 
-# “Bug” board: two solutions (algorithm should detect ambiguity)
+# “Bug” board: empty cells written as 0 instead of -1; it has a single
+# solution, which the solver finds without any user choices
 BUG_BOARD = [
     [0, 0, 0, 2, 6, 0, 7, 0, 1],
     [6, 8, 0, 0, 7, 0, 0, 9, 0],
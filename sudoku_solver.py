@@ -10,251 +10,524 @@ Features
 * Detects invalid boards or boards that reach an unsolvable state.
 * Allows the user to choose digits when multiple options exist (interactive CLI).
 * Can generate a random partially‑filled board.
+* Optional non‑interactive mode (`--auto`) that finishes boards with an exact
+  cover (Algorithm X / Dancing Links) search instead of prompting.
 * Writes final board states and results to `solved_sudoku.txt`.
 
 Usage
 ~~~~~
-$ python sudoku_solver.py
+$ python sudoku_solver.py            # interactive
+$ python sudoku_solver.py --auto     # solve without prompting
 
-Dependencies: only the Python standard library.
+Dependencies: only the Python standard library. If `numba` is installed the
+solver's inner loops are JIT‑compiled.
 """
 
+import argparse
 import random
-from typing import List, Tuple
+from array import array
+from typing import List, TextIO, Tuple
 import boards
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; run the same code as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No‑op stand‑in for `numba.njit`."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # ---------- Constants --------------------------------------------------------
 
 NOT_FINISH = "NOT_FINISH"
 FINISH_SUCCESS = "FINISH_SUCCESS"
 FINISH_FAILURE = "FINISH_FAILURE"
 
+# Boards are flat `bytearray` objects of 81 cells, indexed ``r * 9 + c``;
+# 0 is an empty cell and 1‑9 the placed digits
+Board = bytearray
+EMPTY = 0
+
+# Console / log text of every value a board cell (one byte) can hold;
+# invalid values are shown as‑is so a rejected board can still be logged
+CELL = tuple(" %d " % n if n else "   " for n in range(256))
+
+# Candidate mask stored in `possibilities` for cells that are already filled
+FILLED = 0xFFFF
+
+# Cell index tables (index ``r * 9 + c``), computed once at import
+ROW_OF = tuple(i // 9 for i in range(81))
+COL_OF = tuple(i % 9 for i in range(81))
+BOX_OF = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+BOX_CELLS = tuple(tuple(i for i in range(81) if BOX_OF[i] == b) for b in range(9))
+# The 20 cells sharing a row, column or square with each cell
+PEERS = tuple(tuple(j for j in range(81)
+                    if j != i and (ROW_OF[j] == ROW_OF[i] or COL_OF[j] == COL_OF[i]
+                                   or BOX_OF[j] == BOX_OF[i]))
+              for i in range(81))
+
+# Lookup tables indexed by a 9‑bit candidate mask: the digits it contains and
+# the digit of its lowest set bit
+DIGITS_OF = tuple(tuple(d for d in range(1, 10) if m >> (d - 1) & 1) for m in range(512))
+LOWEST_DIGIT = tuple((m & -m).bit_length() for m in range(512))
+
+# Status codes returned by the compiled `one_stage_core`
+CORE_NOT_FINISH = 0
+CORE_SUCCESS = 1
+CORE_FAILURE = 2
+
 # ---------- Helper functions -------------------------------------------------
 
 
-def option_in_part(row: List[int]) -> List[int]:
-    """Return all digits 1‑9 that *do not* appear in the given 9‑element list."""
-    return [num for num in range(1, 10) if num not in row]
+# Digit bitmasks for every row / column / 3×3 square: bit ``d - 1`` is set
+# iff digit *d* is already used in that part.  Kept as arrays so they can be
+# handed to the compiled workers below.
+_row_mask = array("H", [0] * 9)
+_col_mask = array("H", [0] * 9)
+_sq_mask = array("H", [0] * 9)
 
 
-def options(sudoku_board: List[List[int]], loc: Tuple[int, int]) -> List[int]:
+def flatten_board(rows: List[List[int]]) -> Board:
     """
-    Compute all valid digits for a given (row, col) *loc* on *sudoku_board*.
-    `-1` represents an empty cell; if the cell is already filled the result is [].
+    Convert a 9×9 list‑of‑lists board (as in `boards`) to the flat layout.
+    Both `-1` and 0 are accepted for empty cells.
     """
-    r, c = loc
-    if sudoku_board[r][c] != -1:
-        return []
+    return bytearray(EMPTY if n == -1 else n for row in rows for n in row)
 
-    # Row + column candidates
-    opts_row = option_in_part(sudoku_board[r])
-    opts_col = option_in_part([sudoku_board[i][c] for i in range(9)])
 
-    # 3×3 square candidates
-    square_vals = []
-    r0, c0 = 3 * (r // 3), 3 * (c // 3)
-    for i in range(r0, r0 + 3):
-        for j in range(c0, c0 + 3):
-            square_vals.append(sudoku_board[i][j])
-    opts_square = option_in_part(square_vals)
+def build_masks(sudoku_board: Board) -> None:
+    """Rebuild the row / column / square digit masks from *sudoku_board*."""
+    for i in range(9):
+        _row_mask[i] = _col_mask[i] = _sq_mask[i] = 0
+    for i in range(81):
+        n = sudoku_board[i]
+        if 1 <= n <= 9:
+            set_digit_mask(*divmod(i, 9), n)
 
-    # Intersection of all three sets
-    return [n for n in opts_square if n in opts_row and n in opts_col]
 
+def set_digit_mask(r: int, c: int, n: int) -> None:
+    """Mark digit *n* as used in the row, column and square of (r, c)."""
+    bit = 1 << (n - 1)
+    _row_mask[r] |= bit
+    _col_mask[c] |= bit
+    _sq_mask[BOX_OF[r * 9 + c]] |= bit
 
-def possible_digits(sudoku_board: List[List[int]]) -> List[List[List[int] | None]]:
-    """Return a 9×9 grid mirroring *sudoku_board* with option lists / None."""
-    board_opts = []
-    for r in range(9):
-        row_opts = []
-        for c in range(9):
-            row_opts.append(options(sudoku_board, (r, c)) if sudoku_board[r][c] == -1 else None)
-        board_opts.append(row_opts)
-    return board_opts
 
+def options_mask(loc: Tuple[int, int]) -> int:
+    """Bitmask of the digits not yet used in the row, column and square of *loc*."""
+    r, c = loc
+    return ~(_row_mask[r] | _col_mask[c] | _sq_mask[BOX_OF[r * 9 + c]]) & 0x1FF
 
-def check_final_board(sudoku_board: List[List[int]]) -> bool:
-    """True if there are no empty cells (-1) on the board."""
-    return all(cell != -1 for row in sudoku_board for cell in row)
+
+def options(sudoku_board: Board, loc: Tuple[int, int]) -> List[int]:
+    """
+    Compute all valid digits for a given (row, col) *loc* on *sudoku_board*.
+    0 represents an empty cell; if the cell is already filled the result is [].
+    Relies on the digit masks being in sync with the board (see `build_masks`).
+    """
+    r, c = loc
+    if sudoku_board[r * 9 + c] != EMPTY:
+        return []
+    return list(DIGITS_OF[options_mask(loc)])
+
+
+def possible_digits(sudoku_board: Board) -> array:
+    """
+    Return a flat 81‑entry array (index ``r * 9 + c``) of candidate bitmasks.
+    Filled cells hold `FILLED`; an empty cell without candidates holds 0.
+    """
+    build_masks(sudoku_board)
+    return array("H", [options_mask(divmod(i, 9)) if sudoku_board[i] == EMPTY else FILLED
+                       for i in range(81)])
 
 
 def check_part_for_failure(part: List[int]) -> bool:
     """True if *part* (row / column / square) violates Sudoku uniqueness."""
-    return any(part.count(num) > 1 and num != -1 for num in range(9))
+    seen = 0
+    for n in part:
+        if n == EMPTY:
+            continue
+        if not 1 <= n <= 9:
+            return True  # not a Sudoku digit
+        bit = 1 << (n - 1)
+        if seen & bit:
+            return True
+        seen |= bit
+    return False
 
 
-def is_board_failure(sudoku_board: List[List[int]]) -> bool:
+def is_board_failure(sudoku_board: Board) -> bool:
     """Validate entire board; True indicates a rule violation."""
-    # Rows + columns
+    # Rows + columns (contiguous / strided slices of the flat board)
     for i in range(9):
-        if check_part_for_failure(sudoku_board[i]) or            check_part_for_failure([sudoku_board[r][i] for r in range(9)]):
+        if check_part_for_failure(sudoku_board[i * 9:i * 9 + 9]) or \
+           check_part_for_failure(sudoku_board[i::9]):
             return True
 
     # 3×3 squares
-    for r0 in range(0, 9, 3):
-        for c0 in range(0, 9, 3):
-            square = [sudoku_board[r][c]
-                      for r in range(r0, r0 + 3)
-                      for c in range(c0, c0 + 3)]
-            if check_part_for_failure(square):
-                return True
+    for cells in BOX_CELLS:
+        if check_part_for_failure([sudoku_board[i] for i in cells]):
+            return True
     return False
 
 
-def possible_continuation(possibilities: List[List[List[int] | None]]) -> bool:
-    """True if at least one cell has exactly *one* possible digit."""
-    return any(opt is not None and len(opt) == 1
-               for row in possibilities for opt in row)
+def find_least_options(possibilities: array) -> Tuple[int, int] | None:
+    """Return coordinates of the cell with the fewest (>0) options."""
+    min_len, min_idx = 10, None
+    for i in range(81):
+        m = possibilities[i]
+        if m and m != FILLED:
+            count = m.bit_count()
+            if count < min_len:
+                min_len, min_idx = count, i
+    return None if min_idx is None else divmod(min_idx, 9)
 
+# ---------- Core solving routines -------------------------------------------
 
-def find_least_options(possibilities: List[List[List[int] | None]]) -> Tuple[int, int] | None:
-    """Return coordinates of the cell with the fewest (>0) options."""
-    min_len, min_loc = 10, None
-    for r in range(9):
-        for c in range(9):
-            opts = possibilities[r][c]
-            if opts is not None and 0 < len(opts) < min_len:
-                min_len, min_loc = len(opts), (r, c)
-    return min_loc
 
+@njit(cache=True)
+def _propagate(possibilities: array, row_mask: array, col_mask: array,
+               sq_mask: array, i: int, n: int) -> None:
+    """Compiled worker for `propagate` operating on explicit mask arrays."""
+    bit = 1 << (n - 1)
+    row_mask[ROW_OF[i]] |= bit
+    col_mask[COL_OF[i]] |= bit
+    sq_mask[BOX_OF[i]] |= bit
+    possibilities[i] = FILLED
+    keep = ~bit
+    for p in PEERS[i]:
+        if possibilities[p] != FILLED:
+            possibilities[p] &= keep
 
-def is_out_of_options(possibilities: List[List[List[int] | None]]) -> bool:
-    """True if some empty cell has zero valid digits."""
-    return any(opt is not None and len(opt) == 0
-               for row in possibilities for opt in row)
 
-# ---------- Core solving routines -------------------------------------------
+def propagate(possibilities: array, r: int, c: int, n: int) -> None:
+    """
+    Record digit *n* placed at (r, c): mark the cell filled, update the digit
+    masks and drop *n* from the candidates of its 20 peers.
+    """
+    _propagate(possibilities, _row_mask, _col_mask, _sq_mask, r * 9 + c, n)
+
+
+@njit(cache=True)
+def one_stage_core(sudoku_board: Board, possibilities: array, row_mask: array,
+                   col_mask: array, sq_mask: array) -> int:
+    """
+    Compiled body of `one_stage`: fill single‑candidate cells until stuck.
 
+    Works through a queue of cells (AC‑3 style): initially every empty cell,
+    afterwards only the peers of cells that have just been filled.
 
-def one_stage(sudoku_board: List[List[int]],
-              possibilities: List[List[List[int] | None]]) -> Tuple[str, Tuple[int, int]]:
+    Returns one of the ``CORE_*`` status codes.
+    """
+    # A plain list used as a stack (numba has no deque); the visiting order
+    # does not change the outcome of single‑candidate propagation.
+    queue = [i for i in range(81) if possibilities[i] != FILLED]
+    queued = [possibilities[i] != FILLED for i in range(81)]
+    while queue:
+        i = queue.pop()
+        queued[i] = False
+        m = possibilities[i]
+        if m == FILLED:
+            continue
+        if m == 0:
+            return CORE_FAILURE
+        if m & (m - 1) == 0:  # exactly one candidate (m != 0 here)
+            n = LOWEST_DIGIT[m]
+            sudoku_board[i] = n
+            _propagate(possibilities, row_mask, col_mask, sq_mask, i, n)
+            # Only the peers' domains changed, so only they need a revisit
+            for p in PEERS[i]:
+                if possibilities[p] != FILLED and not queued[p]:
+                    queued[p] = True
+                    queue.append(p)
+
+    # No automatic progress possible
+    for i in range(81):
+        if possibilities[i] != FILLED:
+            return CORE_NOT_FINISH
+    return CORE_SUCCESS
+
+
+def one_stage(sudoku_board: Board,
+              possibilities: array) -> Tuple[str, Tuple[int, int]]:
     """
     Attempt to progress one logical step.
 
+    The board must be valid (see `is_board_failure`); placements only use
+    digits whose bits are clear in all three masks, so it stays valid.
+
     Returns (state, loc):
-        * FINISH_FAILURE, (-1, -1)   – invalid board or contradiction
+        * FINISH_FAILURE, (-1, -1)   – contradiction (cell without options)
         * FINISH_SUCCESS, (10, 10)   – board completely solved
         * NOT_FINISH, (r, c)         – need user input at (r, c)
     """
-    while True:
-        if is_board_failure(sudoku_board) or is_out_of_options(possibilities):
-            return FINISH_FAILURE, (-1, -1)
-
-        if check_final_board(sudoku_board):
-            return FINISH_SUCCESS, (10, 10)
-
-        if not possible_continuation(possibilities):
-            loc = find_least_options(possibilities)
-            return NOT_FINISH, loc
-
-        # Fill any cell with a single candidate
-        updated = False
-        for r in range(9):
-            for c in range(9):
-                opts = possibilities[r][c]
-                if opts is not None and len(opts) == 1:
-                    sudoku_board[r][c] = opts[0]
-                    possibilities[r][c] = None
-                    updated = True
-        if not updated:
-            # No automatic progress possible
-            loc = find_least_options(possibilities)
-            return NOT_FINISH, loc
-
-
-def fill_board(sudoku_board: List[List[int]],
-               possibilities: List[List[List[int] | None]]) -> str:
+    status = one_stage_core(sudoku_board, possibilities,
+                            _row_mask, _col_mask, _sq_mask)
+    if status == CORE_FAILURE:
+        return FINISH_FAILURE, (-1, -1)
+    if status == CORE_SUCCESS:
+        return FINISH_SUCCESS, (10, 10)
+    return NOT_FINISH, find_least_options(possibilities)
+
+
+# ---------- Exact cover solver (Algorithm X / Dancing Links) ----------------
+#
+# Sudoku as exact cover: 729 rows (cell, digit) × 324 columns (cell filled,
+# digit in row, digit in column, digit in square).  Node 0 is the root header,
+# nodes 1‑324 the column headers, and row *k* owns nodes 325 + 4k … 328 + 4k.
+# The links are kept in parallel lists: left, right, up, down, column, size
+# (for headers) and the matrix row of each node.
+
+_DLX_COLUMNS = 324
+
+
+def _dlx_links() -> Tuple[List[int], ...]:
+    """Build the full 729 × 324 Sudoku exact cover matrix as linked lists."""
+    n = _DLX_COLUMNS + 1
+    left = [i - 1 for i in range(n)]
+    left[0] = n - 1
+    right = [i + 1 for i in range(n)]
+    right[-1] = 0
+    up, down, col = list(range(n)), list(range(n)), list(range(n))
+    size, row_of = [0] * n, [-1] * n
+
+    for r in range(9):
+        for c in range(9):
+            for d in range(9):
+                cols = (1 + r * 9 + c, 82 + r * 9 + d,
+                        163 + c * 9 + d, 244 + BOX_OF[r * 9 + c] * 9 + d)
+                first = len(left)
+                for k, h in enumerate(cols):
+                    node = first + k
+                    left.append(first + (k - 1) % 4)
+                    right.append(first + (k + 1) % 4)
+                    up.append(up[h])
+                    down.append(h)
+                    down[up[h]] = node
+                    up[h] = node
+                    col.append(h)
+                    row_of.append((r * 9 + c) * 9 + d)
+                    size[h] += 1
+    return left, right, up, down, col, size, row_of
+
+
+_DLX_LINKS = _dlx_links()
+
+
+def _dlx_cover(links: Tuple[List[int], ...], h: int) -> None:
+    """Remove column *h* and every row intersecting it from the matrix."""
+    left, right, up, down, col, size, _ = links
+    left[right[h]] = left[h]
+    right[left[h]] = right[h]
+    i = down[h]
+    while i != h:
+        j = right[i]
+        while j != i:
+            up[down[j]] = up[j]
+            down[up[j]] = down[j]
+            size[col[j]] -= 1
+            j = right[j]
+        i = down[i]
+
+
+def _dlx_uncover(links: Tuple[List[int], ...], h: int) -> None:
+    """Exactly undo `_dlx_cover` for column *h*."""
+    left, right, up, down, col, size, _ = links
+    i = up[h]
+    while i != h:
+        j = left[i]
+        while j != i:
+            size[col[j]] += 1
+            up[down[j]] = j
+            down[up[j]] = j
+            j = left[j]
+        i = up[i]
+    left[right[h]] = h
+    right[left[h]] = h
+
+
+def _dlx_search(links: Tuple[List[int], ...], solution: List[int]) -> bool:
+    """Algorithm X; on success *solution* holds the chosen matrix rows."""
+    left, right, _, down, col, size, row_of = links
+    if right[0] == 0:
+        return True
+
+    # "Shortest column" heuristic, same idea as `find_least_options`
+    h, j = right[0], right[right[0]]
+    while j != 0:
+        if size[j] < size[h]:
+            h = j
+        j = right[j]
+    if size[h] == 0:
+        return False
+
+    _dlx_cover(links, h)
+    i = down[h]
+    while i != h:
+        solution.append(row_of[i])
+        j = right[i]
+        while j != i:
+            _dlx_cover(links, col[j])
+            j = right[j]
+        if _dlx_search(links, solution):
+            return True
+        j = left[i]
+        while j != i:
+            _dlx_uncover(links, col[j])
+            j = left[j]
+        solution.pop()
+        i = down[i]
+    _dlx_uncover(links, h)
+    return False
+
+
+def auto_solve(sudoku_board: Board) -> Board | None:
+    """
+    Solve *sudoku_board* without user input.
+    Returns a solved copy of the board, or None if it has no solution.
+    """
+    if is_board_failure(sudoku_board):
+        return None
+
+    links = tuple(part[:] for part in _DLX_LINKS)
+    right, col = links[1], links[4]
+    # Pre‑select the matrix rows of the given clues
+    for i in range(81):
+        if sudoku_board[i] != EMPTY:
+            node = _DLX_COLUMNS + 1 + 4 * (i * 9 + sudoku_board[i] - 1)
+            _dlx_cover(links, col[node])
+            j = right[node]
+            while j != node:
+                _dlx_cover(links, col[j])
+                j = right[j]
+
+    solution: List[int] = []
+    if not _dlx_search(links, solution):
+        return None
+    solved = bytearray(sudoku_board)
+    for row in solution:
+        solved[row // 9] = row % 9 + 1
+    return solved
+
+
+def fill_board(sudoku_board: Board,
+               possibilities: array, auto: bool = False) -> str:
     """
     Interactive loop that repeatedly calls `one_stage`.
-    The user is asked to choose a value whenever multiple options exist.
+    The user is asked to choose a value whenever multiple options exist;
+    with *auto* the rest of the board is solved by `auto_solve` instead.
     """
+    if is_board_failure(sudoku_board):
+        return FINISH_FAILURE
+
     state = NOT_FINISH
     while state == NOT_FINISH:
         state, loc = one_stage(sudoku_board, possibilities)
+        if state == NOT_FINISH and auto:
+            solved = auto_solve(sudoku_board)
+            if solved is None:
+                return FINISH_FAILURE
+            sudoku_board[:] = solved
+            return FINISH_SUCCESS
         if state == NOT_FINISH and loc:
             r, c = loc
-            cell_options = possibilities[r][c]
-            sudoku_board[r][c] = 0  # temporary placeholder for display
-            print_board(sudoku_board)
-            print("Options for cell (%d, %d): %s" % (r + 1, c + 1, cell_options))
+            cell_options = DIGITS_OF[possibilities[r * 9 + c]]
+            print_board(sudoku_board, cursor=r * 9 + c)
+            print("Options for cell (%d, %d): %s" % (r + 1, c + 1, list(cell_options)))
             choice = None
             while choice not in cell_options:
                 try:
                     choice = int(input("Choose your option: "))
                 except ValueError:
                     continue
-            sudoku_board[r][c] = choice
-            possibilities = possible_digits(sudoku_board)
+            sudoku_board[r * 9 + c] = choice
+            if is_board_failure(sudoku_board):
+                return FINISH_FAILURE
+            propagate(possibilities, r, c, choice)
     return state
 
 
-def create_random_board(sudoku_board: List[List[int]]) -> None:
+def create_random_board(sudoku_board: Board) -> None:
     """
     Fill *N* random positions (10–19) on an empty board with legal digits.
     """
     N = random.randrange(10, 20)
+    build_masks(sudoku_board)
     positions = [(r, c) for r in range(9) for c in range(9)]
+    random.shuffle(positions)
     filled = 0
-    while filled < N and positions:
-        idx = random.randrange(len(positions))
-        r, c = positions.pop(idx)
-        if sudoku_board[r][c] == -1:
+    for r, c in positions:
+        if filled == N:
+            break
+        if sudoku_board[r * 9 + c] == EMPTY:
             opts = options(sudoku_board, (r, c))
             if opts:
-                sudoku_board[r][c] = random.choice(opts)
+                n = random.choice(opts)
+                sudoku_board[r * 9 + c] = n
+                set_digit_mask(r, c, n)
                 filled += 1
 
 
-def print_board(sudoku_board: List[List[int]]) -> None:
-    """Pretty‑print the current state to the console."""
-    sep = "+---" * 9 + "+"
-    print(sep)
-    for r, row in enumerate(sudoku_board):
-        line = "|".join(" %d " % n if n != -1 else "   " for n in row)
-        print("|" + line + "|")
+def format_board(sudoku_board: Board, cursor: int = -1) -> str:
+    """
+    Return the board as text (the format used on screen and in the log).
+    The cell at index *cursor*, if given, is shown as ` ? `.
+    """
+    cells = [CELL[n] for n in sudoku_board]
+    if cursor >= 0:
+        cells[cursor] = " ? "
+    sep = "+---" * 9 + "+\n"
+    lines = [sep]
+    for r in range(9):
+        lines.append("|" + "|".join(cells[r * 9:r * 9 + 9]) + "|\n")
         if (r + 1) % 3 == 0:
-            print(sep)
+            lines.append(sep)
+    return "".join(lines)
+
 
+def print_board(sudoku_board: Board, cursor: int = -1) -> None:
+    """Pretty‑print the current state to the console, marking *cursor*."""
+    print(format_board(sudoku_board, cursor), end="")
 
-def print_board_to_file(sudoku_board: List[List[int]], file_name: str) -> None:
-    """Append the board to *file_name* in a readable text format."""
-    with open(file_name, "a", encoding="utf-8") as f:
-        f.write("+---" * 9 + "+\n")
-        for r, row in enumerate(sudoku_board):
-            line = "|".join(f" {n} " if n != -1 else "   " for n in row)
-            f.write("|" + line + "|\n")
-            if (r + 1) % 3 == 0:
-                f.write("+---" * 9 + "+\n")
+
+def print_board_to_file(sudoku_board: Board, f: TextIO) -> None:
+    """Write the board to the open text file *f* in a readable format."""
+    f.write(format_board(sudoku_board))
 
 
 # ---------- Script entry point ----------------------------------------------
 
 
 def main() -> None:
-    # Prepare boards (copy so originals remain unmodified)
+    parser = argparse.ArgumentParser(description="Console Sudoku assistant/solver.")
+    parser.add_argument("--auto", action="store_true",
+                        help="solve boards without prompting for choices")
+    args = parser.parse_args()
+
+    # Prepare boards (flat copies so originals remain unmodified)
     board_list = [
-        [row[:] for row in boards.EXAMPLE_BOARD],
-        [row[:] for row in boards.PERFECT_BOARD],
-        [row[:] for row in boards.IMPOSSIBLE_BOARD],
-        [row[:] for row in boards.BUG_BOARD],
-        [row[:] for row in boards.INTERESTING_BOARD],
+        flatten_board(boards.EXAMPLE_BOARD),
+        flatten_board(boards.PERFECT_BOARD),
+        flatten_board(boards.IMPOSSIBLE_BOARD),
+        flatten_board(boards.BUG_BOARD),
+        flatten_board(boards.INTERESTING_BOARD),
     ]
     create_random_board(board_list[-1])  # add randomness to the last board
 
-    # Reset log file
-    with open("solved_sudoku.txt", "w", encoding="utf-8"):
-        pass
-
-    # Solve / play each board
-    for idx, board in enumerate(board_list, 1):
-        print(f"\n=== Board {idx} ===")
-        possibilities = possible_digits(board)
-        result = fill_board(board, possibilities)
+    # Solve / play each board, logging to a file opened once for the run
+    with open("solved_sudoku.txt", "w", encoding="utf-8") as f:
+        for idx, board in enumerate(board_list, 1):
+            print(f"\n=== Board {idx} ===")
+            possibilities = possible_digits(board)
+            result = fill_board(board, possibilities, auto=args.auto)
 
-        with open("solved_sudoku.txt", "a", encoding="utf-8") as f:
             f.write(result + "\n")
-        print_board_to_file(board, "solved_sudoku.txt")
-        print(f"Result: {result}")
+            print_board_to_file(board, f)
+            print(f"Result: {result}")
 
 
 if __name__ == "__main__":